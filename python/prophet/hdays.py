@@ -8,18 +8,229 @@ from __future__ import absolute_import, division, print_function
 
 import warnings
 from datetime import date, timedelta
+from functools import lru_cache
 
 from convertdate.islamic import from_gregorian, to_gregorian
 from lunarcalendar import Lunar, Converter
 
 from holidays import WEEKEND, HolidayBase, Turkey
 from dateutil.easter import easter, EASTER_ORTHODOX
-from dateutil.relativedelta import relativedelta as rd
+
+
+# Calendar conversions are pure functions of their arguments and are repeated
+# with the same arguments across neighbouring years, so memoize them.
+_from_gregorian = lru_cache(maxsize=4096)(from_gregorian)
+_to_gregorian = lru_cache(maxsize=4096)(to_gregorian)
+_easter = lru_cache(maxsize=512)(easter)
+
+
+@lru_cache(maxsize=1024)
+def _lunar_to_solar(year, month, day):
+    """Convert a Chinese lunar calendar date to a Gregorian date."""
+    return Converter.Lunar2Solar(Lunar(year, month, day)).to_date()
+
+
+def _islamic_dates(year, month, day, days=1):
+    """Return the dates in Gregorian `year` of an Islamic calendar holiday.
+
+    The holiday starts on the given Islamic month and day and lasts for `days`
+    consecutive days. An Islamic year is ~354 days long, so a Gregorian year
+    only overlaps the Islamic year it starts in and the two following ones.
+    """
+    start = date(year, 1, 1) - timedelta(days=days - 1)
+    islam_year = _from_gregorian(start.year, start.month, start.day)[0]
+    dates = []
+    for offset in range(3):
+        first_day = date(*_to_gregorian(islam_year + offset, month, day))
+        for i in range(days):
+            ds = first_day + timedelta(days=i)
+            if ds.year == year:
+                dates.append(ds)
+    return dates
+
+
+def _add_holidays(holidays, pairs):
+    """Add a sequence of (date, name) pairs to a HolidayBase instance.
+
+    The pairs are inserted with a single dict update, bypassing the per-item
+    HolidayBase.__setitem__. Item assignment, which merges the names of
+    holidays falling on the same date, is only used when a date is repeated
+    or already present.
+    """
+    batch = dict(pairs)
+    if len(batch) == len(pairs) and holidays.keys().isdisjoint(batch):
+        dict.update(holidays, batch)
+    else:
+        for ds, name in pairs:
+            holidays[ds] = name
+
+
+def _fixed_holidays(year, table):
+    """Return (date, name) pairs for a table of (month, day, name) holidays."""
+    return [(date(year, month, day), name) for month, day, name in table]
+
+
+def _easter_holidays(easter_sunday, table):
+    """Return (date, name) pairs for a table of (days after Easter, name)."""
+    return [
+        (easter_sunday + timedelta(days=days), name) for days, name in table
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _cached_year_holidays(cls, year, observed):
+    """Return the holidays of `cls` in `year` as a tuple, computed once."""
+    return tuple(cls._year_holidays(year, observed))
+
+
+class _CachedHolidayBase(HolidayBase):
+    """
+    HolidayBase whose holidays in a year only depend on the year
+
+    Subclasses list fixed-date holidays in `_FIXED_HOLIDAYS` as
+    (month, day, name) tuples, or override `_year_holidays` to compute them.
+    The holidays of a year are computed once per class and then shared
+    between its instances. The class tables are only read on the first
+    computation, so changing them afterwards requires clearing
+    `_cached_year_holidays`.
+    """
+
+    _FIXED_HOLIDAYS = ()
+
+    def _populate(self, year):
+        _add_holidays(
+            self, _cached_year_holidays(type(self), year, self.observed)
+        )
+
+    @classmethod
+    def _year_holidays(cls, year, observed):
+        """Return the holidays in `year` as a list of (date, name) pairs."""
+        return _fixed_holidays(year, cls._FIXED_HOLIDAYS)
+
+
+# Holidays determined by calendars that are not currently available are hard
+# coded as {year: (month, day)} lookup tables.
+
+# Day of Silence / Nyepi in Indonesia
+_NYEPI_DATES = {
+    2009: (3, 26),
+    2010: (3, 16),
+    2011: (3, 5),
+    2012: (3, 23),
+    2013: (3, 12),
+    2014: (3, 31),
+    2015: (3, 21),
+    2016: (3, 9),
+    2017: (3, 28),
+    2018: (3, 17),
+    2019: (3, 7),
+}
+
+# Diwali in India
+_DIWALI = {
+    2010: (12, 5),
+    2011: (10, 26),
+    2012: (11, 13),
+    2013: (11, 3),
+    2014: (10, 23),
+    2015: (11, 11),
+    2016: (10, 30),
+    2017: (10, 19),
+    2018: (11, 7),
+    2019: (10, 27),
+    2020: (11, 14),
+    2021: (11, 4),
+    2022: (10, 24),
+    2023: (10, 12),
+    2024: (11, 1),
+    2025: (10, 21),
+    2026: (11, 8),
+    2027: (10, 29),
+    2028: (10, 17),
+    2029: (11, 5),
+    2030: (10, 26),
+}
+
+# Holi in India
+_HOLI = {
+    2010: (2, 28),
+    2011: (3, 19),
+    2012: (3, 8),
+    2013: (3, 26),
+    2014: (3, 17),
+    2015: (3, 6),
+    2016: (3, 24),
+    2017: (3, 13),
+    2018: (3, 2),
+    2019: (3, 21),
+    2020: (3, 9),
+    2021: (3, 28),
+    2022: (3, 18),
+    2023: (3, 7),
+    2024: (3, 25),
+    2025: (3, 14),
+    2026: (3, 3),
+    2027: (3, 22),
+    2028: (3, 11),
+    2029: (2, 28),
+    2030: (3, 19),
+}
+
+# Magha Puja in Thailand
+_MAGHA_PUJA = {
+    2016: (2, 22),
+    2017: (2, 11),
+    2018: (3, 1),
+    2019: (2, 19),
+}
+
+# Asalha Puja in Thailand
+_ASALHA_PUJA = {
+    2006: (7, 11),
+    2007: (6, 30),
+    2008: (7, 18),
+    2009: (7, 7),
+    2010: (7, 25),
+    2011: (7, 15),
+    2012: (8, 2),
+    2013: (7, 30),
+    2014: (7, 13),
+    2015: (7, 30),
+    2016: (7, 15),
+    2017: (7, 9),
+    2018: (7, 29),
+    2019: (7, 16),
+    2020: (7, 5),
+    2021: (7, 24),
+    2022: (7, 13),
+    2023: (7, 3),
+    2024: (7, 21),
+    2025: (7, 10),
+}
+
+# Beginning of Vassa in Thailand
+_VASSA = {
+    2006: (7, 12),
+    2007: (7, 31),
+    2008: (7, 19),
+    2009: (7, 8),
+    2010: (7, 27),
+    2011: (7, 16),
+    2012: (8, 3),
+    2013: (7, 23),
+    2014: (7, 13),
+    2015: (8, 1),
+    2016: (7, 20),
+    2017: (7, 9),
+    2018: (7, 28),
+    2019: (7, 17),
+    2020: (7, 6),
+}
 
 
 # Official public holidays at a country level
 # ------------ Holidays in Indonesia---------------------
-class Indonesia(HolidayBase):
+class Indonesia(_CachedHolidayBase):
     """
     Implement public holidays in Indonesia
 
@@ -30,130 +241,81 @@ class Indonesia(HolidayBase):
     the national wide public holidays.
     """
 
-    def __init__(self, **kwargs):
-        self.country = "ID"
-        HolidayBase.__init__(self, **kwargs)
+    country = "ID"
 
     def _populate(self, year):
+        if year not in _NYEPI_DATES:
+            warning_msg = "We only support Nyepi holiday from 2009 to 2019"
+            warnings.warn(warning_msg, Warning)
+        super()._populate(year)
+
+    @classmethod
+    def _year_holidays(cls, year, observed):
+        holidays = []
+
         # New Year's Day
-        if not self.observed and date(year, 1, 1).weekday() in WEEKEND:
+        new_year = date(year, 1, 1)
+        if not observed and new_year.weekday() in WEEKEND:
             pass
         else:
-            self[date(year, 1, 1)] = "New Year's Day"
+            holidays.append((new_year, "New Year's Day"))
 
         # Chinese New Year/ Spring Festival
-        name = "Chinese New Year"
-        for offset in range(-1, 2, 1):
-            ds = Converter.Lunar2Solar(Lunar(year + offset, 1, 1)).to_date()
-            if ds.year == year:
-                self[ds] = name
+        holidays.append((_lunar_to_solar(year, 1, 1), "Chinese New Year"))
 
         # Day of Silence / Nyepi
         # Note:
         # This holiday is determined by Balinese calendar, which is not currently
         # available. Only hard coded version of this holiday from 2009 to 2019
         # is available.
-        warning_msg = "We only support Nyepi holiday from 2009 to 2019"
-        warnings.warn(warning_msg, Warning)
-
-        name = "Day of Silence/ Nyepi"
-        if year == 2009:
-            self[date(year, 3, 26)] = name
-        elif year == 2010:
-            self[date(year, 3, 16)] = name
-        elif year == 2011:
-            self[date(year, 3, 5)] = name
-        elif year == 2012:
-            self[date(year, 3, 23)] = name
-        elif year == 2013:
-            self[date(year, 3, 12)] = name
-        elif year == 2014:
-            self[date(year, 3, 31)] = name
-        elif year == 2015:
-            self[date(year, 3, 21)] = name
-        elif year == 2016:
-            self[date(year, 3, 9)] = name
-        elif year == 2017:
-            self[date(year, 3, 28)] = name
-        elif year == 2018:
-            self[date(year, 3, 17)] = name
-        elif year == 2019:
-            self[date(year, 3, 7)] = name
-        else:
-            pass
+        if year in _NYEPI_DATES:
+            holidays.append((date(year, *_NYEPI_DATES[year]), "Day of Silence/ Nyepi"))
 
         # Ascension of the Prophet
         name = "Ascension of the Prophet"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 3, 17)[0]
-            y, m, d = to_gregorian(islam_year, 7, 27)
-            if y == year:
-                self[date(y, m, d)] = name
+        for ds in _islamic_dates(year, 7, 27):
+            holidays.append((ds, name))
 
         # Labor Day
-        name = "Labor Day"
-        self[date(year, 5, 1)] = name
+        holidays.append((date(year, 5, 1), "Labor Day"))
 
         # Ascension of Jesus Christ
-        name = "Ascension of Jesus"
-        for offset in range(-1, 2, 1):
-            ds = easter(year + offset) + rd(days=+39)
-            if ds.year == year:
-                self[ds] = name
+        holidays.append((_easter(year) + timedelta(days=39), "Ascension of Jesus"))
 
         # Buddha's Birthday
-        name = "Buddha's Birthday"
-        for offset in range(-1, 2, 1):
-            ds = Converter.Lunar2Solar(Lunar(year + offset, 4, 15)).to_date()
-            if ds.year == year:
-                self[ds] = name
+        holidays.append((_lunar_to_solar(year, 4, 15), "Buddha's Birthday"))
 
         # Pancasila Day, since 2017
         if year >= 2017:
-            name = "Pancasila Day"
-            self[date(year, 6, 1)] = name
+            holidays.append((date(year, 6, 1), "Pancasila Day"))
 
         # Eid al-Fitr
         name = "Eid al-Fitr"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 6, 15)[0]
-            y1, m1, d1 = to_gregorian(islam_year, 10, 1)
-            y2, m2, d2 = to_gregorian(islam_year, 10, 2)
-            if y1 == year:
-                self[date(y1, m2, d2)] = name
-            if y2 == year:
-                self[date(y2, m2, d2)] = name
+        for ds in _islamic_dates(year, 10, 1, days=2):
+            holidays.append((ds, name))
 
         # Independence Day
-        name = "Independence Day"
-        self[date(year, 8, 17)] = name
+        holidays.append((date(year, 8, 17), "Independence Day"))
 
         # Feast of the Sacrifice
         name = "Feast of the Sacrifice"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 8, 22)[0]
-            y, m, d = to_gregorian(islam_year, 12, 10)
-            if y == year:
-                self[date(y, m, d)] = name
+        for ds in _islamic_dates(year, 12, 10):
+            holidays.append((ds, name))
 
         # Islamic New Year
         name = "Islamic New Year"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 9, 11)[0]
-            y, m, d = to_gregorian(islam_year + 1, 1, 1)
-            if y == year:
-                self[date(y, m, d)] = name
+        for ds in _islamic_dates(year, 1, 1):
+            holidays.append((ds, name))
 
         # Birth of the Prophet
         name = "Birth of the Prophet"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 11, 20)[0]
-            y, m, d = to_gregorian(islam_year + 1, 3, 12)
-            if y == year:
-                self[date(y, m, d)] = name
+        for ds in _islamic_dates(year, 3, 12):
+            holidays.append((ds, name))
 
         # Christmas
-        self[date(year, 12, 25)] = "Christmas"
+        holidays.append((date(year, 12, 25), "Christmas"))
+
+        return holidays
 
 
 class ID(Indonesia):
@@ -161,7 +323,7 @@ class ID(Indonesia):
 
 
 # ------------ Holidays in India---------------------
-class India(HolidayBase):
+class India(_CachedHolidayBase):
     """
     Implement public holidays in India
     Reference:
@@ -172,28 +334,46 @@ class India(HolidayBase):
     and territories** celebrate.
     """
 
-    def __init__(self, **kwargs):
-        self.country = "IN"
-        HolidayBase.__init__(self, **kwargs)
+    country = "IN"
+
+    # Three national days
+    _NATIONAL_HOLIDAYS = (
+        (1, 26, "Republic Day"),
+        (8, 15, "Independence Day"),
+        (10, 2, "Gandhi Jayanti"),
+    )
+
+    # Christian holidays on fixed dates
+    _CHRISTIAN_HOLIDAYS = (
+        (1, 1, "New Year's Day"),
+        (9, 5, "Fest of St. Theresa of Calcutta"),
+        (9, 8, "Feast of the Blessed Virgin"),
+        (11, 1, "All Saints Day"),
+        (11, 2, "All Souls Day"),
+        (12, 25, "Christmas Day"),
+        (12, 26, "Boxing Day"),
+        (12, 30, "Feast of Holy Family"),
+    )
+
+    # (days after Easter Sunday, name)
+    _EASTER_HOLIDAYS = (
+        (-7, "Palm Sunday"),
+        (-3, "Maundy Thursday"),
+        (-2, "Good Friday"),
+        (0, "Easter Sunday"),
+        (49, "Feast of Pentecost"),
+    )
 
     def _populate(self, year):
-        # --------------------------------
-        # Three national days
-        #     Republic Day
-        #     Independence Day
-        #     Gandhi Jayanti
-        # --------------------------------
-        # Republic Day
-        name = "Republic Day"
-        self[date(year, 1, 26)] = name
+        if year not in _DIWALI or year not in _HOLI:
+            warning_msg = "We only support Diwali and Holi holidays from 2010 to 2030"
+            warnings.warn(warning_msg, Warning)
+        super()._populate(year)
 
-        # Independence Day
-        name = "Independence Day"
-        self[date(year, 8, 15)] = name
+    @classmethod
+    def _year_holidays(cls, year, observed):
+        holidays = _fixed_holidays(year, cls._NATIONAL_HOLIDAYS)
 
-        # Gandhi Jayanti
-        name = "Gandhi Jayanti"
-        self[date(year, 10, 2)] = name
         # --------------------------------
         # Hindu holidays
         #     Diwali
@@ -205,75 +385,9 @@ class India(HolidayBase):
         # https://www.timeanddate.com/holidays/india/diwali?starty=
         # https://www.infoplease.com/calendar-holidays/major-holidays/
         # https://www.learnreligions.com/when-is-holi-1770208
-        warning_msg = "We only support Diwali and Holi holidays from 2010 to 2030"
-        warnings.warn(warning_msg, Warning)
-        name1 = "Diwali"
-        name2 = "Holi"
-        if year == 2010:
-            self[date(year, 12, 5)] = name1
-            self[date(year, 2, 28)] = name2
-        elif year == 2011:
-            self[date(year, 10, 26)] = name1
-            self[date(year, 3, 19)] = name2
-        elif year == 2012:
-            self[date(year, 11, 13)] = name1
-            self[date(year, 3, 8)] = name2
-        elif year == 2013:
-            self[date(year, 11, 3)] = name1
-            self[date(year, 3, 26)] = name2
-        elif year == 2014:
-            self[date(year, 10, 23)] = name1
-            self[date(year, 3, 17)] = name2
-        elif year == 2015:
-            self[date(year, 11, 11)] = name1
-            self[date(year, 3, 6)] = name2
-        elif year == 2016:
-            self[date(year, 10, 30)] = name1
-            self[date(year, 3, 24)] = name2
-        elif year == 2017:
-            self[date(year, 10, 19)] = name1
-            self[date(year, 3, 13)] = name2
-        elif year == 2018:
-            self[date(year, 11, 7)] = name1
-            self[date(year, 3, 2)] = name2
-        elif year == 2019:
-            self[date(year, 10, 27)] = name1
-            self[date(year, 3, 21)] = name2
-        elif year == 2020:
-            self[date(year, 11, 14)] = name1
-            self[date(year, 3, 9)] = name2
-        elif year == 2021:
-            self[date(year, 11, 4)] = name1
-            self[date(year, 3, 28)] = name2
-        elif year == 2022:
-            self[date(year, 10, 24)] = name1
-            self[date(year, 3, 18)] = name2
-        elif year == 2023:
-            self[date(year, 10, 12)] = name1
-            self[date(year, 3, 7)] = name2
-        elif year == 2024:
-            self[date(year, 11, 1)] = name1
-            self[date(year, 3, 25)] = name2
-        elif year == 2025:
-            self[date(year, 10, 21)] = name1
-            self[date(year, 3, 14)] = name2
-        elif year == 2026:
-            self[date(year, 11, 8)] = name1
-            self[date(year, 3, 3)] = name2
-        elif year == 2027:
-            self[date(year, 10, 29)] = name1
-            self[date(year, 3, 22)] = name2
-        elif year == 2028:
-            self[date(year, 10, 17)] = name1
-            self[date(year, 3, 11)] = name2
-        elif year == 2029:
-            self[date(year, 11, 5)] = name1
-            self[date(year, 2, 28)] = name2
-        elif year == 2030:
-            self[date(year, 10, 26)] = name1
-            self[date(year, 3, 19)] = name2
-        else:
-            pass
+        if year in _DIWALI and year in _HOLI:
+            holidays.append((date(year, *_DIWALI[year]), "Diwali"))
+            holidays.append((date(year, *_HOLI[year]), "Holi"))
 
         # --------------------------------
         # Islamic holidays
@@ -286,128 +400,40 @@ class India(HolidayBase):
         # Day of Ashura
         # 10th day of 1st Islamic month
         name = "Day of Ashura"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 10, 1)[0]
-            y, m, d = to_gregorian(islam_year, 1, 10)
-            if y == year:
-                self[date(y, m, d)] = name
+        for ds in _islamic_dates(year, 1, 10):
+            holidays.append((ds, name))
 
         # Mawlid, Birth of the Prophet
         # 12th day of 3rd Islamic month
         name = "Mawlid"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 11, 20)[0]
-            y, m, d = to_gregorian(islam_year, 3, 12)
-            if y == year:
-                self[date(y, m, d)] = name
+        for ds in _islamic_dates(year, 3, 12):
+            holidays.append((ds, name))
 
         # Eid ul-Fitr
         # 1st and 2nd day of 10th Islamic month
         name = "Eid al-Fitr"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 6, 15)[0]
-            y1, m1, d1 = to_gregorian(islam_year, 10, 1)
-            y2, m2, d2 = to_gregorian(islam_year, 10, 2)
-            if y1 == year:
-                self[date(y1, m1, d1)] = name
-            if y2 == year:
-                self[date(y2, m2, d2)] = name
+        for ds in _islamic_dates(year, 10, 1, days=2):
+            holidays.append((ds, name))
 
         # Eid al-Adha, i.e., Feast of the Sacrifice
         name = "Feast of the Sacrifice"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 8, 22)[0]
-            y, m, d = to_gregorian(islam_year, 12, 10)
-            if y == year:
-                self[date(y, m, d)] = name
-
-        # --------------------------------
-        # Christian holidays
-        #    New Year, Palm Sunday,
-        #    Maundy Thursday
-        #    Good Friday
-        #    Easter Sunday
-        #    Feast of Pentecost
-        #    Fest of St. Theresa of Calcutta
-        #    Feast of the Blessed Virgin
-        #    All Saints Day
-        #    All Souls Day
-        #    Christmas Day
-        #    Boxing Day
-        #    Feast of Holy Family
-        # --------------------------------
-        # New Year's Day
-        self[date(year, 1, 1)] = "New Year's Day"
-
-        # Palm Sunday
-        name = "Palm Sunday"
-        for offset in range(-1, 2, 1):
-            ds = easter(year + offset) - rd(days=7)
-            if ds.year == year:
-                self[ds] = name
+        for ds in _islamic_dates(year, 12, 10):
+            holidays.append((ds, name))
 
-        # Maundy Thursday
-        name = "Maundy Thursday"
-        for offset in range(-1, 2, 1):
-            ds = easter(year + offset) - rd(days=3)
-            if ds.year == year:
-                self[ds] = name
+        # Christian holidays relative to Easter Sunday
+        holidays += _easter_holidays(_easter(year), cls._EASTER_HOLIDAYS)
 
-        # Good Friday
-        name = "Good Friday"
-        for offset in range(-1, 2, 1):
-            ds = easter(year + offset) - rd(days=2)
-            if ds.year == year:
-                self[ds] = name
+        # Christian holidays on fixed dates
+        holidays += _fixed_holidays(year, cls._CHRISTIAN_HOLIDAYS)
 
-        # Easter Sunday
-        name = "Easter Sunday"
-        for offset in range(-1, 2, 1):
-            ds = easter(year + offset)
-            if ds.year == year:
-                self[ds] = name
-
-        # Feast of Pentecost
-        name = "Feast of Pentecost"
-        for offset in range(-1, 2, 1):
-            ds = easter(year + offset) + rd(days=49)
-            if ds.year == year:
-                self[ds] = name
-
-        # Fest of St. Theresa of Calcutta
-        name = "Fest of St. Theresa of Calcutta"
-        self[date(year, 9, 5)] = name
-
-        # Feast of the Blessed Virgin
-        name = "Feast of the Blessed Virgin"
-        self[date(year, 9, 8)] = name
-
-        # All Saints Day
-        name = "All Saints Day"
-        self[date(year, 11, 1)] = name
-
-        # All Souls Day
-        name = "All Souls Day"
-        self[date(year, 11, 2)] = name
-
-        # Christmas
-        name = "Christmas Day"
-        self[date(year, 12, 25)] = name
-
-        # Boxing Day
-        name = "Boxing Day"
-        self[date(year, 12, 26)] = name
-
-        # Feast of Holy Family
-        name = "Feast of Holy Family"
-        self[date(year, 12, 30)] = name
+        return holidays
 
 
 class IN(India):
     pass
 
 # ------------ Holidays in Kyrgyzstan---------------------
-class Kyrgyzstan(HolidayBase):
+class Kyrgyzstan(_CachedHolidayBase):
     """
     Implement public holidays in Kyrgyzstan
     Reference:
@@ -416,77 +442,31 @@ class Kyrgyzstan(HolidayBase):
     June 1st is a childrens day which iscelebrated but is not a day off, the are day off.
     """
 
-    def __init__(self, **kwargs):
-        self.country = "KG"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        # New Year's Day
-        name = "New Year's Day"
-        self[date(year, 1, 1)] = name
-
-        # Orthodox Christmas day
-        name = "Orthodox Christmas Day"
-        self[date(year, 1, 7)] = name
-
-        # Feb. 23 Fatherland Defender's Day
-        name = "Fatherland Defender's Day"
-        self[date(year, 2, 23)] = name
-
-        # International Women's Day
-        name = "International Women's Day"
-        self[date(year, 3, 8)] = name
-
-        # Nooruz Mairamy
-        name = "Nooruz Mairamy"
-        self[date(year, 3, 21)] = name
-        
-        # Day of the People's April Revolution
-        name = "Day of the People's April Revolution"
-        self[date(year, 4, 7)] = name
-        
-        # Spring and Labour Day
-        name = "Spring and Labour Day"
-        self[date(year, 5, 1)] = name
-        
-        # Spring and Labour Day
-        name = "Spring and Labour Day"
-        self[date(year, 5, 1)] = name
-        
-        # Constitution Day
-        name = "Constitution Day"
-        self[date(year, 5, 5)] = name
-
-        # Victory Day
-        name = "Victory Day"
-        self[date(year, 5, 9)] = name
-
-        # Children's Day
-        name = "Russia Day"
-        self[date(year, 6, 1)] = name
-        
-        # Independence Day
-        name = "Independence Day"
-        self[date(year, 8, 31)] = name
-        
-        # Day 1 of History and Commemoration of Ancestors
-        name = "Day 1 of History and Commemoration of Ancestors"
-        self[date(year, 11, 7)] = name
-        
-        # Day 2 of History and Commemoration of Ancestors
-        name = "Day 2 of History and Commemoration of Ancestors"
-        self[date(year, 11, 8)] = name
-
-        # New Year's Eve
-        name = "New Year's Eve"
-        self[date(year, 12, 31)] = name
+    country = "KG"
+
+    _FIXED_HOLIDAYS = (
+        (1, 1, "New Year's Day"),
+        (1, 7, "Orthodox Christmas Day"),
+        (2, 23, "Fatherland Defender's Day"),
+        (3, 8, "International Women's Day"),
+        (3, 21, "Nooruz Mairamy"),
+        (4, 7, "Day of the People's April Revolution"),
+        (5, 1, "Spring and Labour Day"),
+        (5, 5, "Constitution Day"),
+        (5, 9, "Victory Day"),
+        (6, 1, "Russia Day"),
+        (8, 31, "Independence Day"),
+        (11, 7, "Day 1 of History and Commemoration of Ancestors"),
+        (11, 8, "Day 2 of History and Commemoration of Ancestors"),
+        (12, 31, "New Year's Eve"),
+    )
 
 
 class KG(Kyrgyzstan):
     pass
 
 # ------------ Holidays in Thailand---------------------
-class Thailand(HolidayBase):
+class Thailand(_CachedHolidayBase):
     """
     Implement public holidays in Thailand
 
@@ -494,14 +474,35 @@ class Thailand(HolidayBase):
     https://en.wikipedia.org/wiki/Public_holidays_in_Thailand
     """
 
-    def __init__(self, **kwargs):
-        self.country = "TH"
-        HolidayBase.__init__(self, **kwargs)
+    country = "TH"
+
+    _FIXED_HOLIDAYS = (
+        (1, 1, "New Year's Day"),
+        (4, 14, "Songkran Festival"),
+        (7, 28, "King Maha Vajiralongkorn's Birthday"),
+        (8, 12, "The Queen Sirikit's Birthday"),
+        (10, 13, "Anniversary for the Death of King Bhumibol Adulyadej"),
+        (10, 23, "King Chulalongkorn Day"),
+        (12, 5, "King Bhumibol Adulyadej's Birthday Anniversary"),
+        (12, 10, "Constitution Day"),
+        (12, 31, "New Year's Eve"),
+    )
+
+    # Days to shift Chakri Memorial Day by, indexed by the weekday of April 6
+    _CHAKRI_SHIFT = (0, 0, 0, 0, 0, 2, 1)
 
     def _populate(self, year):
-        # New Year's Day
-        name = "New Year's Day"
-        self[date(year, 1, 1)] = name
+        if year not in _ASALHA_PUJA:
+            warning_msg = "We only support Asalha Puja holiday from 2006 to 2025"
+            warnings.warn(warning_msg, Warning)
+        if year not in _VASSA:
+            warning_msg = "We only support Vassa holiday from 2006 to 2020"
+            warnings.warn(warning_msg, Warning)
+        super()._populate(year)
+
+    @classmethod
+    def _year_holidays(cls, year, observed):
+        holidays = _fixed_holidays(year, cls._FIXED_HOLIDAYS)
 
         # Magha Pujab
         # Note:
@@ -509,162 +510,37 @@ class Thailand(HolidayBase):
         # available. Only hard coded version of this holiday from 2016 to 2019
         # is available.
 
-        name = "Magha Pujab/Makha Bucha"
-        if year == 2016:
-            self[date(year, 2, 22)] = name
-        elif year == 2017:
-            self[date(year, 2, 11)] = name
-        elif year == 2018:
-            self[date(year, 3, 1)] = name
-        elif year == 2019:
-            self[date(year, 2, 19)] = name
-        else:
-            pass
-
-        # Chakri Memorial Day
-        name = "Chakri Memorial Day"
-        april_6 = date(year, 4, 6).weekday()
-        if april_6 == 5:
-            self[date(year, 4, 6 + 2)] = name
-        elif april_6 == 6:
-            self[date(year, 4, 6 + 1)] = name
-        else:
-            self[date(year, 4, 6)] = name
+        if year in _MAGHA_PUJA:
+            holidays.append((date(year, *_MAGHA_PUJA[year]), "Magha Pujab/Makha Bucha"))
 
-        # Songkran Festival
-        name = "Songkran Festival"
-        self[date(year, 4, 14)] = name
+        # Chakri Memorial Day, moved to Monday when it falls on a weekend
+        april_6 = date(year, 4, 6)
+        shift = cls._CHAKRI_SHIFT[april_6.weekday()]
+        holidays.append((april_6 + timedelta(days=shift), "Chakri Memorial Day"))
 
         # Royal Ploughing Ceremony
         # arbitrary day in May
 
         # Buddha's Birthday
-        name = "Buddha's Birthday"
-        for offset in range(-1, 2, 1):
-            ds = Converter.Lunar2Solar(Lunar(year + offset, 4, 15)).to_date()
-            if ds.year == year:
-                self[ds] = name
+        holidays.append((_lunar_to_solar(year, 4, 15), "Buddha's Birthday"))
 
         # Coronation Day, removed in 2017
-        name = "Coronation Day"
         if year < 2017:
-            self[date(year, 5, 5)] = name
-
-        # King Maha Vajiralongkorn's Birthday
-        name = "King Maha Vajiralongkorn's Birthday"
-        self[date(year, 7, 28)] = name
+            holidays.append((date(year, 5, 5), "Coronation Day"))
 
         # Asalha Puja
         # This is also a Buddha holiday, and we only implement
         # the hard coded version from 2006 to 2025
         # reference:
         # http://www.when-is.com/asalha_puja.asp
-        warning_msg = "We only support Asalha Puja holiday from 2006 to 2025"
-        warnings.warn(warning_msg, Warning)
-        name = "Asalha Puja"
-        if year == 2006:
-            self[date(year, 7, 11)] = name
-        elif year == 2007:
-            self[date(year, 6, 30)] = name
-        elif year == 2008:
-            self[date(year, 7, 18)] = name
-        elif year == 2009:
-            self[date(year, 7, 7)] = name
-        elif year == 2010:
-            self[date(year, 7, 25)] = name
-        elif year == 2011:
-            self[date(year, 7, 15)] = name
-        elif year == 2012:
-            self[date(year, 8, 2)] = name
-        elif year == 2013:
-            self[date(year, 7, 30)] = name
-        elif year == 2014:
-            self[date(year, 7, 13)] = name
-        elif year == 2015:
-            self[date(year, 7, 30)] = name
-        elif year == 2016:
-            self[date(year, 7, 15)] = name
-        elif year == 2017:
-            self[date(year, 7, 9)] = name
-        elif year == 2018:
-            self[date(year, 7, 29)] = name
-        elif year == 2019:
-            self[date(year, 7, 16)] = name
-        elif year == 2020:
-            self[date(year, 7, 5)] = name
-        elif year == 2021:
-            self[date(year, 7, 24)] = name
-        elif year == 2022:
-            self[date(year, 7, 13)] = name
-        elif year == 2023:
-            self[date(year, 7, 3)] = name
-        elif year == 2024:
-            self[date(year, 7, 21)] = name
-        elif year == 2025:
-            self[date(year, 7, 10)] = name
-        else:
-            pass
+        if year in _ASALHA_PUJA:
+            holidays.append((date(year, *_ASALHA_PUJA[year]), "Asalha Puja"))
 
         # Beginning of Vassa
-        warning_msg = "We only support Vassa holiday from 2006 to 2020"
-        warnings.warn(warning_msg, Warning)
-        name = "Beginning of Vassa"
-        if year == 2006:
-            self[date(year, 7, 12)] = name
-        elif year == 2007:
-            self[date(year, 7, 31)] = name
-        elif year == 2008:
-            self[date(year, 7, 19)] = name
-        elif year == 2009:
-            self[date(year, 7, 8)] = name
-        elif year == 2010:
-            self[date(year, 7, 27)] = name
-        elif year == 2011:
-            self[date(year, 7, 16)] = name
-        elif year == 2012:
-            self[date(year, 8, 3)] = name
-        elif year == 2013:
-            self[date(year, 7, 23)] = name
-        elif year == 2014:
-            self[date(year, 7, 13)] = name
-        elif year == 2015:
-            self[date(year, 8, 1)] = name
-        elif year == 2016:
-            self[date(year, 7, 20)] = name
-        elif year == 2017:
-            self[date(year, 7, 9)] = name
-        elif year == 2018:
-            self[date(year, 7, 28)] = name
-        elif year == 2019:
-            self[date(year, 7, 17)] = name
-        elif year == 2020:
-            self[date(year, 7, 6)] = name
-        else:
-            pass
-
-        # The Queen Sirikit's Birthday
-        name = "The Queen Sirikit's Birthday"
-        self[date(year, 8, 12)] = name
-
-        # Anniversary for the Death of King Bhumibol Adulyadej
-        name = "Anniversary for the Death of King Bhumibol Adulyadej"
-        self[date(year, 10, 13)] = name
-
-        # King Chulalongkorn Day
-        name = "King Chulalongkorn Day"
-        self[date(year, 10, 23)] = name
-
-        # King Bhumibol Adulyadej's Birthday Anniversary
-        name = "King Bhumibol Adulyadej's Birthday Anniversary"
-        self[date(year, 12, 5)] = name
-
-        # Constitution Day
-        name = "Constitution Day"
-        self[date(year, 12, 10)] = name
+        if year in _VASSA:
+            holidays.append((date(year, *_VASSA[year]), "Beginning of Vassa"))
 
-        # New Year's Eve
-        name = "New Year's Eve"
-        self[date(year, 12, 31)] = name
+        return holidays
 
 
 class TH(Thailand):
@@ -672,7 +548,7 @@ class TH(Thailand):
 
 
 # ------------ Holidays in Philippines---------------------
-class Philippines(HolidayBase):
+class Philippines(_CachedHolidayBase):
     """
     Implement public holidays in Philippines
 
@@ -680,73 +556,54 @@ class Philippines(HolidayBase):
     https://en.wikipedia.org/wiki/Public_holidays_in_Thailand
     """
 
-    def __init__(self, **kwargs):
-        self.country = "PH"
-        HolidayBase.__init__(self, **kwargs)
+    country = "PH"
 
-    def _populate(self, year):
-        # New Year's Day
-        name = "New Year's Day"
-        self[date(year, 1, 1)] = name
+    _FIXED_HOLIDAYS = (
+        (1, 1, "New Year's Day"),
+        (4, 9, "Day of Valor"),
+        (5, 1, "Labor Day"),
+        (6, 12, "Independence Day"),
+    )
 
-        # Maundy Thursday
-        name = "Maundy Thursday"
-        for offset in range(-1, 2, 1):
-            ds = easter(year + offset) - rd(days=3)
-            if ds.year == year:
-                self[ds] = name
-
-        # Good Friday
-        name = "Good Friday"
-        for offset in range(-1, 2, 1):
-            ds = easter(year + offset) - rd(days=2)
-            if ds.year == year:
-                self[ds] = name
+    # (days after Easter Sunday, name)
+    _EASTER_HOLIDAYS = (
+        (-3, "Maundy Thursday"),
+        (-2, "Good Friday"),
+    )
 
-        # Day of Valor
-        name = "Day of Valor"
-        self[date(year, 4, 9)] = name
-
-        # Labor Day
-        name = "Labor Day"
-        self[date(year, 5, 1)] = name
-
-        # Independence Day
-        name = "Independence Day"
-        self[date(year, 6, 12)] = name
+    @classmethod
+    def _year_holidays(cls, year, observed):
+        # Christian holidays relative to Easter Sunday
+        holidays = _easter_holidays(_easter(year), cls._EASTER_HOLIDAYS)
+        holidays += _fixed_holidays(year, cls._FIXED_HOLIDAYS)
 
         # Eid al-Fitr
         name = "Eid al-Fitr"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 6, 15)[0]
-            y, m, d = to_gregorian(islam_year, 10, 1)
-            ds = date(y, m, d) - timedelta(days=1)
+        # Observed on the eve of the 1st day of the 10th Islamic month, which
+        # may itself fall on January 1st of the next year
+        for ds in _islamic_dates(year, 10, 1) + _islamic_dates(year + 1, 10, 1):
+            ds -= timedelta(days=1)
             if ds.year == year:
-                self[ds] = name
+                holidays.append((ds, name))
 
         # Eid al-Adha, i.e., Feast of the Sacrifice
         name = "Feast of the Sacrifice"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 8, 22)[0]
-            y, m, d = to_gregorian(islam_year, 12, 10)
-            if y == year:
-                self[date(y, m, d)] = name
+        for ds in _islamic_dates(year, 12, 10):
+            holidays.append((ds, name))
 
         # National Heroes' Day
-        name = "National Heroes' Day"
-        self[date(year, 8, 27)] = name
+        holidays.append((date(year, 8, 27), "National Heroes' Day"))
 
         # Bonifacio Day
-        name = "Bonifacio Day"
-        self[date(year, 11, 30)] = name
+        holidays.append((date(year, 11, 30), "Bonifacio Day"))
 
         # Christmas Day
-        name = "Christmas Day"
-        self[date(year, 12, 25)] = name
+        holidays.append((date(year, 12, 25), "Christmas Day"))
 
         # Rizal Day
-        name = "Rizal Day"
-        self[date(year, 12, 30)] = name
+        holidays.append((date(year, 12, 30), "Rizal Day"))
+
+        return holidays
 
 
 class PH(Philippines):
@@ -763,7 +620,7 @@ class TU(Turkey):
 
 
 # ------------ Holidays in Pakistan---------------------
-class Pakistan(HolidayBase):
+class Pakistan(_CachedHolidayBase):
     """
     Implement public holidays in Pakistan
 
@@ -771,101 +628,56 @@ class Pakistan(HolidayBase):
     https://en.wikipedia.org/wiki/Public_holidays_in_Pakistan
     """
 
-    def __init__(self, **kwargs):
-        self.country = "PK"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-
-        # Kashmir Solidarity Day
-        name = "Kashmir Solidarity Day"
-        self[date(year, 2, 5)] = name
-
-        # Pakistan Day
-        name = "Pakistan Day"
-        self[date(year, 3, 23)] = name
-
-        # Labor Day
-        name = "Labor Day"
-        self[date(year, 5, 1)] = name
-
-        # Independence Day
-        name = "Independence Day"
-        self[date(year, 8, 14)] = name
-
-        # Iqbal Day
-        name = "Iqbal Day"
-        self[date(year, 11, 9)] = name
+    country = "PK"
 
-        # Christmas Day
+    _FIXED_HOLIDAYS = (
+        (2, 5, "Kashmir Solidarity Day"),
+        (3, 23, "Pakistan Day"),
+        (5, 1, "Labor Day"),
+        (8, 14, "Independence Day"),
+        (11, 9, "Iqbal Day"),
         # Also birthday of PK founder
-        name = "Christmas Day"
-        self[date(year, 12, 25)] = name
+        (12, 25, "Christmas Day"),
+    )
+
+    @classmethod
+    def _year_holidays(cls, year, observed):
+        holidays = _fixed_holidays(year, cls._FIXED_HOLIDAYS)
 
         # Eid al-Adha, i.e., Feast of the Sacrifice
         name = "Feast of the Sacrifice"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 8, 22)[0]
-            y1, m1, d1 = to_gregorian(islam_year, 12, 10)
-            y2, m2, d2 = to_gregorian(islam_year, 12, 11)
-            y3, m3, d3 = to_gregorian(islam_year, 12, 12)
-            if y1 == year:
-                self[date(y1, m1, d1)] = name
-            if y2 == year:
-                self[date(y2, m2, d2)] = name
-            if y3 == year:
-                self[date(y3, m3, d3)] = name
+        for ds in _islamic_dates(year, 12, 10, days=3):
+            holidays.append((ds, name))
 
         # Eid al-Fitr
         name = "Eid al-Fitr"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 6, 15)[0]
-            y1, m1, d1 = to_gregorian(islam_year, 10, 1)
-            y2, m2, d2 = to_gregorian(islam_year, 10, 2)
-            y3, m3, d3 = to_gregorian(islam_year, 10, 3)
-            if y1 == year:
-                self[date(y1, m1, d1)] = name
-            if y2 == year:
-                self[date(y2, m2, d2)] = name
-            if y3 == year:
-                self[date(y3, m3, d3)] = name
+        for ds in _islamic_dates(year, 10, 1, days=3):
+            holidays.append((ds, name))
 
         # Mawlid, Birth of the Prophet
         # 12th day of 3rd Islamic month
         name = "Mawlid"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 11, 20)[0]
-            y, m, d = to_gregorian(islam_year, 3, 12)
-            if y == year:
-                self[date(y, m, d)] = name
+        for ds in _islamic_dates(year, 3, 12):
+            holidays.append((ds, name))
 
         # Day of Ashura
         # 10th and 11th days of 1st Islamic month
         name = "Day of Ashura"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 10, 1)[0]
-            y1, m1, d1 = to_gregorian(islam_year, 1, 10)
-            y2, m2, d2 = to_gregorian(islam_year, 1, 11)
-            if y1 == year:
-                self[date(y1, m1, d1)] = name
-            if y2 == year:
-                self[date(y2, m2, d2)] = name
+        for ds in _islamic_dates(year, 1, 10, days=2):
+            holidays.append((ds, name))
 
         # Shab e Mairaj
         name = "Shab e Mairaj"
-        for offset in range(-1, 2, 1):
-            islam_year = from_gregorian(year + offset, 4, 13)[0]
-            y, m, d = to_gregorian(islam_year, 7, 27)
-            if y == year:
-                self[date(y, m, d)] = name
+        for ds in _islamic_dates(year, 7, 27):
+            holidays.append((ds, name))
 
         # Defence Day
-        name = "Defence Day"
-        self[date(year, 9, 6)] = name
+        holidays.append((date(year, 9, 6), "Defence Day"))
 
         # Death Anniversary of Quaid-e-Azam
-        name = "Death Anniversary of Quaid-e-Azam"
-        self[date(year, 9, 11)] = name
+        holidays.append((date(year, 9, 11), "Death Anniversary of Quaid-e-Azam"))
+
+        return holidays
 
 
 class PK(Pakistan):
@@ -873,7 +685,7 @@ class PK(Pakistan):
 
 
 # ------------ Holidays in Russia---------------------
-class Russia(HolidayBase):
+class Russia(_CachedHolidayBase):
     """
     Implement public holidays in Russia
     Reference:
@@ -883,50 +695,20 @@ class Russia(HolidayBase):
     But the Dec. 25 Christmas is also celebrated.
     """
 
-    def __init__(self, **kwargs):
-        self.country = "RU"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        # New Year's Day
-        name = "New Year's Day"
-        self[date(year, 1, 1)] = name
-
-        # Orthodox Christmas day
-        name = "Orthodox Christmas Day"
-        self[date(year, 1, 7)] = name
-
-        # Dec. 25 Christmas Day
-        name = "Christmas Day"
-        self[date(year, 12, 25)] = name
+    country = "RU"
 
-        # Defender of the Fatherland Day
-        name = "Defender of the Fatherland Day"
-        self[date(year, 2, 23)] = name
-
-        # International Women's Day
-        name = "International Women's Day"
-        self[date(year, 3, 8)] = name
-
-        # National Flag Day
-        name = "National Flag Day"
-        self[date(year, 8, 22)] = name
-
-        # Spring and Labour Day
-        name = "Spring and Labour Day"
-        self[date(year, 5, 1)] = name
-
-        # Victory Day
-        name = "Victory Day"
-        self[date(year, 5, 9)] = name
-
-        # Russia Day
-        name = "Russia Day"
-        self[date(year, 6, 12)] = name
-
-        # Unity Day
-        name = "Unity Day"
-        self[date(year, 11, 4)] = name
+    _FIXED_HOLIDAYS = (
+        (1, 1, "New Year's Day"),
+        (1, 7, "Orthodox Christmas Day"),
+        (12, 25, "Christmas Day"),
+        (2, 23, "Defender of the Fatherland Day"),
+        (3, 8, "International Women's Day"),
+        (8, 22, "National Flag Day"),
+        (5, 1, "Spring and Labour Day"),
+        (5, 9, "Victory Day"),
+        (6, 12, "Russia Day"),
+        (11, 4, "Unity Day"),
+    )
 
 
 class RU(Russia):
@@ -934,7 +716,7 @@ class RU(Russia):
 
 
 # ------------ Holidays in Belarus---------------------
-class Belarus(HolidayBase):
+class Belarus(_CachedHolidayBase):
     """
     Implement public holidays in Belarus
 
@@ -946,46 +728,31 @@ class Belarus(HolidayBase):
     as International Women's Day
     """
 
-    def __init__(self, **kwargs):
-        self.country = "BY"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        # New Year's Day
-        name = "New Year's Day"
-        self[date(year, 1, 1)] = name
-
-        # Orthodox Christmas day
-        name = "Orthodox Christmas Day"
-        self[date(year, 1, 7)] = name
-
-        # International Women's Day
-        name = "International Women's Day"
-        self[date(year, 3, 8)] = name
-
-        # Commemoration Day
-        name = "Commemoration Day"
-        self[easter(year, EASTER_ORTHODOX) + timedelta(days=9)] = name
+    country = "BY"
 
-        # Spring and Labour Day
-        name = "Spring and Labour Day"
-        self[date(year, 5, 1)] = name
+    _FIXED_HOLIDAYS = (
+        (1, 1, "New Year's Day"),
+        (1, 7, "Orthodox Christmas Day"),
+        (3, 8, "International Women's Day"),
+        (5, 1, "Spring and Labour Day"),
+        (5, 9, "Victory Day"),
+        (7, 3, "Independence Day"),
+        (11, 7, "October Revolution Day"),
+        (12, 25, "Christmas Day"),
+    )
 
-        # Victory Day
-        name = "Victory Day"
-        self[date(year, 5, 9)] = name
-
-        # Independence Day
-        name = "Independence Day"
-        self[date(year, 7, 3)] = name
+    # (days after Orthodox Easter Sunday, name)
+    _EASTER_HOLIDAYS = (
+        (9, "Commemoration Day"),
+    )
 
-        # October Revolution Day
-        name = "October Revolution Day"
-        self[date(year, 11, 7)] = name
+    @classmethod
+    def _year_holidays(cls, year, observed):
+        orthodox_easter = _easter(year, EASTER_ORTHODOX)
+        holidays = _easter_holidays(orthodox_easter, cls._EASTER_HOLIDAYS)
+        holidays += _fixed_holidays(year, cls._FIXED_HOLIDAYS)
 
-        # Dec. 25 Christmas Day
-        name = "Christmas Day"
-        self[date(year, 12, 25)] = name
+        return holidays
 
 
 class BY(Belarus):
@@ -993,85 +760,46 @@ class BY(Belarus):
 
 
 # ------------ Holidays in Georgia---------------------
-class Georgia(HolidayBase):
+class Georgia(_CachedHolidayBase):
     """
     Implement public holidays in Georgia
     Reference:
     https://en.wikipedia.org/wiki/Public_holidays_in_Georgia_(country)
     """
 
-    def __init__(self, **kwargs):
-        self.country = "GE"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        # New Year's Day
-        name = "New Year's Day"
-        self[date(year, 1, 1)] = name
-
-        # New Year's Day
-        name = "Second day of the New Year"
-        self[date(year, 1, 2)] = name
-
-        # Christmas Day (Orthodox)
-        name = "Orthodox Christmas"
-        self[date(year, 1, 7)] = name
-
-        # Baptism Day of our Lord Jesus Christ
-        name = "Baptism Day of our Lord Jesus Christ"
-        self[date(year, 1, 19)] = name
-
-        # Mother's Day
-        name = "Mother's Day"
-        self[date(year, 3, 3)] = name
-
-        # Women's Day
-        name = "International Women's Day"
-        self[date(year, 3, 8)] = name
-
-        # Orthodox Good Friday
-        name = "Good Friday"
-        self[easter(year, EASTER_ORTHODOX) - timedelta(days=2)] = name
-
-        # Orthodox Holy Saturday
-        name = "Great Saturday"
-        self[easter(year, EASTER_ORTHODOX) - timedelta(days=1)] = name
-
-        # 	Orthodox Easter Sunday
-        name = "Easter Sunday"
-        self[easter(year, EASTER_ORTHODOX)] = name
-
-        # Orthodox Easter Monday
-        name = "Easter Monday"
-        self[easter(year, EASTER_ORTHODOX) + timedelta(days=1)] = name
-
-        # National Unity Day
-        name = "National Unity Day"
-        self[date(year, 4, 9)] = name
-
-        # Day of Victory
-        name = "Victory Day"
-        self[date(year, 5, 9)] = name
-
-        # Saint Andrew the First-Called Day
-        name = "Saint Andrew the First-Called Day"
-        self[date(year, 5, 12)] = name
-
-        # Independence Day
-        name = "Independence Day"
-        self[date(year, 5, 26)] = name
-
-        # Saint Mary's Day
-        name = "Saint Mary's Day"
-        self[date(year, 8, 28)] = name
-
-        # Day of Svetitskhoveli Cathedral
-        name = "Day of Svetitskhoveli Cathedral"
-        self[date(year, 10, 14)] = name
-
-        # Saint George's Day
-        name = "Saint George's Day"
-        self[date(year, 12, 23)] = name
+    country = "GE"
+
+    _FIXED_HOLIDAYS = (
+        (1, 1, "New Year's Day"),
+        (1, 2, "Second day of the New Year"),
+        (1, 7, "Orthodox Christmas"),
+        (1, 19, "Baptism Day of our Lord Jesus Christ"),
+        (3, 3, "Mother's Day"),
+        (3, 8, "International Women's Day"),
+        (4, 9, "National Unity Day"),
+        (5, 9, "Victory Day"),
+        (5, 12, "Saint Andrew the First-Called Day"),
+        (5, 26, "Independence Day"),
+        (8, 28, "Saint Mary's Day"),
+        (10, 14, "Day of Svetitskhoveli Cathedral"),
+        (12, 23, "Saint George's Day"),
+    )
+
+    # (days after Orthodox Easter Sunday, name)
+    _EASTER_HOLIDAYS = (
+        (-2, "Good Friday"),
+        (-1, "Great Saturday"),
+        (0, "Easter Sunday"),
+        (1, "Easter Monday"),
+    )
+
+    @classmethod
+    def _year_holidays(cls, year, observed):
+        orthodox_easter = _easter(year, EASTER_ORTHODOX)
+        holidays = _easter_holidays(orthodox_easter, cls._EASTER_HOLIDAYS)
+        holidays += _fixed_holidays(year, cls._FIXED_HOLIDAYS)
+
+        return holidays
 
 
 class GE(Georgia):
@@ -0,0 +1,82 @@
+# Copyright (c) Facebook, Inc. and its affiliates.
+
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import warnings
+from datetime import date
+from unittest import TestCase
+
+from prophet import hdays
+
+
+class TestHdays(TestCase):
+    def make_holidays(self, country, years):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return getattr(hdays, country)(years=years)
+
+    def test_islamic_holidays_every_year(self):
+        # Islamic holidays falling early or late in a Gregorian year used to
+        # be skipped for some years
+        for country in ['ID', 'IN', 'PH', 'PK']:
+            holidays = self.make_holidays(country, [2020])
+            self.assertEqual(
+                holidays.get(date(2020, 7, 31)), 'Feast of the Sacrifice')
+        holidays = self.make_holidays('PK', [2020])
+        self.assertEqual(
+            holidays.get(date(2020, 8, 1)), 'Feast of the Sacrifice')
+        self.assertEqual(
+            holidays.get(date(2020, 8, 2)), 'Feast of the Sacrifice')
+        holidays = self.make_holidays('ID', [2019])
+        self.assertEqual(holidays.get(date(2019, 9, 1)), 'Islamic New Year')
+        holidays = self.make_holidays('IN', [2012])
+        self.assertEqual(holidays.get(date(2012, 2, 5)), 'Mawlid')
+        holidays = self.make_holidays('PK', [2012])
+        self.assertEqual(
+            holidays.get(date(2012, 2, 5)), 'Mawlid, Kashmir Solidarity Day')
+
+    def test_indonesia_eid_al_fitr(self):
+        # Eid al-Fitr lasts two days in Indonesia
+        holidays = self.make_holidays('ID', [2020, 2021])
+        for ds in [date(2020, 5, 24), date(2020, 5, 25), date(2021, 5, 14)]:
+            self.assertEqual(holidays.get(ds), 'Eid al-Fitr')
+        # The first day of 2021 falls on Ascension of Jesus
+        self.assertEqual(
+            holidays.get(date(2021, 5, 13)), 'Eid al-Fitr, Ascension of Jesus')
+
+    def test_merged_holiday_names(self):
+        # Holidays on the same date keep the order of names they always had
+        holidays = self.make_holidays('BY', [2000])
+        self.assertEqual(
+            holidays.get(date(2000, 5, 9)), 'Victory Day, Commemoration Day')
+        holidays = self.make_holidays('IN', [1974])
+        self.assertEqual(
+            holidays.get(date(1974, 12, 25)),
+            'Christmas Day, Feast of the Sacrifice')
+
+    def test_subclass_holidays(self):
+        class Custom(hdays.RU):
+            _FIXED_HOLIDAYS = ((7, 4, 'Custom Day'),)
+
+        # Subclasses overriding the holiday tables get their own holidays
+        self.assertEqual(
+            dict(Custom(years=[2020])), {date(2020, 7, 4): 'Custom Day'})
+        self.assertEqual(
+            dict(hdays.RU(years=[2020])), dict(hdays.Russia(years=[2020])))
+
+    def test_unsupported_year_warning(self):
+        # Warnings are not lost when the year was first populated with
+        # warnings suppressed
+        self.make_holidays('TH', [2030])
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            hdays.TH(years=[2030])
+        self.assertIn(
+            'We only support Vassa holiday from 2006 to 2020',
+            [str(warning.message) for warning in w])